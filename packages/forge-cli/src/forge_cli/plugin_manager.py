@@ -13,29 +13,42 @@ import os
 import re
 import subprocess
 import sys
+import tempfile
 import urllib.error
 import urllib.request
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 import yaml
 
 from forge_cli.system_deps import SystemDepSpec, install_system_deps, parse_system_deps
+from forge_core.registry import binary_plugin_cache_path, forge_config_dir
+
+# owner/repo slug from https, ssh (git@github.com:owner/repo) or git+ sources
+_GITHUB_REPO_RE = re.compile(r"github\.com[/:]([^/]+/[^/.#]+)")
 
 
 class PluginManager:
     """Manages external FORGE plugins from git repositories."""
 
-    def __init__(self, registry_path: Path | None = None):
+    def __init__(
+        self,
+        registry_path: Path | None = None,
+        uv_runner: Callable[[list[str]], int | None] | None = None,
+    ):
         """Initialize plugin manager.
 
         Args:
             registry_path: Explicit path to plugins-registry.yaml (for testing/CI).
                           If None, uses the standard resolution order:
                           FORGE_PLUGIN_REGISTRY env var → user config → bundled default.
+            uv_runner: Callable that runs ``uv`` with the given arguments and returns
+                       its exit code (or None if uv is unavailable). Defaults to
+                       running the real ``uv`` binary; tests pass a stub.
         """
         self._explicit_registry_path = registry_path
         self._registry: dict[str, dict[str, Any]] | None = None
+        self._uv_runner = uv_runner or self._run_uv
 
     def _get_registry_content(self) -> str:
         """Read registry YAML content using the resolution order."""
@@ -61,7 +74,7 @@ class PluginManager:
             return path.read_text()
 
         # 3. User-local additions and overrides
-        user_path = Path.home() / ".config" / "forge" / "plugins-registry.yaml"
+        user_path = forge_config_dir() / "plugins-registry.yaml"
         if user_path.exists():
             return user_path.read_text()
 
@@ -128,18 +141,18 @@ class PluginManager:
         if self._running_as_uv_tool():
             # Target forge's isolated tool venv directly via its Python executable.
             # This works regardless of uv version (no 'uv tool inject' needed).
-            return self._run_uv(
+            return self._uv_runner(
                 ["pip", "install", "--python", sys.executable, package_url]
             )
-        return self._run_uv(["pip", "install", package_url])
+        return self._uv_runner(["pip", "install", package_url])
 
     def _uninstall_package(self, package_name: str) -> int | None:
         """Uninstall a Python package from the correct environment."""
         if self._running_as_uv_tool():
-            return self._run_uv(
+            return self._uv_runner(
                 ["pip", "uninstall", "--python", sys.executable, "-y", package_name]
             )
-        return self._run_uv(["pip", "uninstall", "-y", package_name])
+        return self._uv_runner(["pip", "uninstall", "-y", package_name])
 
     def list_available(
         self, tag_filter: str | None = None
@@ -183,7 +196,7 @@ class PluginManager:
 
         Returns the tag name (e.g. 'v1.2.3') or None on failure.
         """
-        match = re.search(r"github\.com[/:]([^/]+/[^/.#]+)", source_url)
+        match = _GITHUB_REPO_RE.search(source_url)
         if not match:
             return None
         repo_slug = match.group(1)
@@ -342,7 +355,7 @@ class PluginManager:
             )
             return None
 
-        cache_path = Path.home() / ".config" / "forge" / "binary-plugins.json"
+        cache_path = binary_plugin_cache_path()
         cache_path.parent.mkdir(parents=True, exist_ok=True)
         try:
             cache = json.loads(cache_path.read_text()) if cache_path.exists() else {}
@@ -352,7 +365,7 @@ class PluginManager:
             "binary_path": str(binary_path),
             "introspect_data": introspect_data,
         }
-        cache_path.write_text(json.dumps(cache, indent=2))
+        _write_binary_cache(cache_path, cache)
         return introspect_data
 
     def _install_binary_plugin(self, name: str, plugin_info: dict[str, Any]) -> int:
@@ -514,12 +527,12 @@ class PluginManager:
         else:
             print(f"  Warning: Binary not found at {binary_path}", file=sys.stderr)
 
-        cache_path = Path.home() / ".config" / "forge" / "binary-plugins.json"
+        cache_path = binary_plugin_cache_path()
         if cache_path.exists():
             try:
                 cache = json.loads(cache_path.read_text())
                 cache.pop(name, None)
-                cache_path.write_text(json.dumps(cache, indent=2))
+                _write_binary_cache(cache_path, cache)
             except Exception:
                 pass
 
@@ -527,11 +540,31 @@ class PluginManager:
         return 0
 
 
+def _write_binary_cache(cache_path: Path, cache: dict[str, Any]) -> None:
+    """Atomically replace the binary plugin cache with ``cache``.
+
+    The JSON is written to a temp file in the same directory and renamed over the
+    old cache, so an interrupted write never leaves a truncated file behind for
+    plugin discovery to trip over. On any failure the temp file is removed.
+    """
+    with tempfile.NamedTemporaryFile(
+        "w", dir=cache_path.parent, suffix=".tmp", delete=False
+    ) as tmp:
+        try:
+            tmp.write(json.dumps(cache, indent=2))
+            tmp.close()
+            os.replace(tmp.name, cache_path)
+        except BaseException:
+            tmp.close()
+            Path(tmp.name).unlink(missing_ok=True)
+            raise
+
+
 def is_plugin_installed(info: dict[str, Any]) -> bool:
     """Return True if the plugin's package is currently installed in this environment."""
     plugin_type = info.get("plugin_type", "native")
     if plugin_type == "binary":
-        cache_path = Path.home() / ".config" / "forge" / "binary-plugins.json"
+        cache_path = binary_plugin_cache_path()
         if not cache_path.exists():
             return False
         try:
@@ -13,6 +13,7 @@ import yaml
 from forge_core.auth import get_chainctl_token
 from forge_core.context import ExecutionContext
 from forge_core.plugin import ResultStatus, ToolParam, ToolPlugin
+from forge_core.registry import forge_config_dir
 
 # Map ToolParam.type strings to Python types for argparse
 TYPE_MAP: dict[str, type] = {
@@ -81,7 +82,7 @@ def _console_progress(fraction: float, message: str) -> None:
 
 def _load_config() -> dict:
     """Load forge config from ~/.config/forge/config.yaml, if present."""
-    config_path = Path.home() / ".config" / "forge" / "config.yaml"
+    config_path = forge_config_dir() / "config.yaml"
     if config_path.exists():
         try:
             return yaml.safe_load(config_path.read_text()) or {}
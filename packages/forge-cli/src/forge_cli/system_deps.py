@@ -15,7 +15,7 @@ from pathlib import Path
 from typing import Any, Callable
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SystemDepSpec:
     """A single non-Python binary dependency for a plugin."""
 
@@ -31,7 +31,7 @@ class SystemDepSpec:
     install_dir: str = "~/.local/bin"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SystemDepResult:
     """Outcome of installing (or skipping) a single system dependency."""
 
@@ -14,6 +14,16 @@ logger = logging.getLogger(__name__)
 ENTRY_POINT_GROUP = "forge.plugins"
 
 
+def forge_config_dir() -> Path:
+    """Return the per-user FORGE config directory (~/.config/forge)."""
+    return Path.home() / ".config" / "forge"
+
+
+def binary_plugin_cache_path() -> Path:
+    """Return the path of the binary plugin introspection cache."""
+    return forge_config_dir() / "binary-plugins.json"
+
+
 def discover_plugins() -> dict[str, ToolPlugin]:
     """Find all installed packages that declare a forge.plugins entry point,
     plus any binary plugins cached at ~/.config/forge/binary-plugins.json.
@@ -88,7 +98,7 @@ def _discover_binary_plugins() -> dict[str, ToolPlugin]:
     """Load binary plugins from ~/.config/forge/binary-plugins.json."""
     from forge_core.binary_plugin import BinaryPlugin
 
-    cache_path = Path.home() / ".config" / "forge" / "binary-plugins.json"
+    cache_path = binary_plugin_cache_path()
     if not cache_path.exists():
         return {}
 
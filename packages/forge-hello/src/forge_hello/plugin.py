@@ -31,30 +31,34 @@ class HelloPlugin:
         count = args.get("count", 1)
         verbose = args.get("verbose", False)
 
-        ctx.progress(0.0, "Starting greetings")
+        # Loop invariants: the greeting never changes, and progress is reported
+        # at most ~100 times however large count gets (ceiling division, so
+        # e.g. count=150 reports every 2nd greeting rather than every one).
+        greeting = f"Hello, {name}!"
+        progress = ctx.progress
+        report_every = max(1, -(-count // 100))
 
-        greetings = []
-        for i in range(count):
+        progress(0.0, "Starting greetings")
+
+        for i in range(1, count + 1):
             if ctx.is_cancelled:
                 return ToolResult(
                     status=ResultStatus.CANCELLED, summary="Cancelled by user"
                 )
 
-            greeting = f"Hello, {name}!"
-            greetings.append(greeting)
-
-            if verbose:
-                ctx.progress((i + 1) / count, f"Greeting {i + 1}/{count}: {greeting}")
-            else:
-                ctx.progress((i + 1) / count, f"Progress: {i + 1}/{count}")
+            if i % report_every == 0 or i == count:
+                if verbose:
+                    progress(i / count, f"Greeting {i}/{count}: {greeting}")
+                else:
+                    progress(i / count, f"Progress: {i}/{count}")
 
             # Simulate some work
             time.sleep(0.1)
 
-        ctx.progress(1.0, "Done")
+        progress(1.0, "Done")
 
         return ToolResult(
             status=ResultStatus.SUCCESS,
             summary=f"Generated {count} greeting(s) for {name}",
-            data={"name": name, "count": count, "greetings": greetings},
+            data={"name": name, "count": count, "greetings": [greeting] * count},
         )
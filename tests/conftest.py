@@ -2,12 +2,14 @@
 
 import pytest
 
+from forge_cli.system_deps import SystemDepResult, SystemDepSpec
+from forge_core.context import ExecutionContext
+from forge_core.plugin import ResultStatus, ToolParam, ToolResult
 
-@pytest.fixture
-def sample_tool_params():
-    """Sample tool parameters for testing."""
-    from forge_core.plugin import ToolParam
 
+@pytest.fixture(scope="session")
+def sample_tool_params():
+    """Sample tool parameters for testing (shared, read-only)."""
     return [
         ToolParam(name="org", description="Organization name", required=True),
         ToolParam(name="limit", description="Max items", type="int", default=10),
@@ -15,10 +17,9 @@ def sample_tool_params():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_plugin():
-    """Mock plugin for testing."""
-    from forge_core.plugin import ToolParam, ToolResult, ResultStatus
+    """Mock plugin for testing (shared, stateless)."""
 
     class MockPlugin:
         name = "mock"
@@ -39,3 +40,32 @@ def mock_plugin():
             )
 
     return MockPlugin()
+
+
+@pytest.fixture(scope="module")
+def shared_ctx():
+    """Execution context for tests that neither cancel nor inspect progress."""
+    return ExecutionContext()
+
+
+@pytest.fixture(scope="session")
+def go_spec():
+    """System dependency spec for the go-tool test plugin (frozen, shared)."""
+    return SystemDepSpec(manager="go", package="github.com/org/go-tool@v1.2.3", binary="go-tool")
+
+
+@pytest.fixture(scope="session")
+def go_success_result(go_spec):
+    """Successful install result for ``go_spec``."""
+    return SystemDepResult(spec=go_spec, already_installed=False, success=True, error_message=None)
+
+
+@pytest.fixture(scope="session")
+def go_failure_result(go_spec):
+    """Failed install result for ``go_spec`` (Go runtime missing)."""
+    return SystemDepResult(
+        spec=go_spec,
+        already_installed=False,
+        success=False,
+        error_message="Go runtime not found. Install Go from https://go.dev/dl/",
+    )
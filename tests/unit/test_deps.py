@@ -0,0 +1,34 @@
+"""Tests for forge_core.deps."""
+
+from __future__ import annotations
+
+import pytest
+
+from forge_core import deps
+from forge_core.deps import assert_dependencies, check_dependencies
+
+TOOLS = ["chainctl", "crane", "cosign"]
+
+
+@pytest.mark.parametrize(
+    "which_return,expected_missing",
+    [(None, TOOLS), ("/usr/local/bin/tool", [])],
+    ids=["all-missing", "all-present"],
+)
+def test_check_dependencies(monkeypatch, which_return, expected_missing):
+    monkeypatch.setattr(deps.shutil, "which", lambda name: which_return)
+
+    checks = check_dependencies(TOOLS)
+
+    assert [c.name for c in checks] == TOOLS
+    assert [c.name for c in checks if not c.available] == expected_missing
+    assert all(c.path == which_return for c in checks)
+
+
+def test_assert_dependencies_lists_missing_tools(monkeypatch):
+    monkeypatch.setattr(
+        deps.shutil, "which", lambda name: None if name == "cosign" else f"/usr/bin/{name}"
+    )
+
+    with pytest.raises(RuntimeError, match="Missing required tools: cosign"):
+        assert_dependencies(TOOLS)
@@ -0,0 +1,43 @@
+"""Tests for the bundled hello plugin."""
+
+import pytest
+
+from forge_core.context import ExecutionContext
+from forge_core.plugin import ResultStatus
+from forge_hello.plugin import HelloPlugin
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    """Skip the simulated work so tests run instantly."""
+    monkeypatch.setattr("forge_hello.plugin.time.sleep", lambda _: None)
+
+
+def test_run_returns_greetings():
+    ctx = ExecutionContext()
+
+    result = HelloPlugin().run({"name": "World", "count": 3}, ctx)
+
+    assert result.status == ResultStatus.SUCCESS
+    assert result.data["greetings"] == ["Hello, World!"] * 3
+
+
+@pytest.mark.parametrize("count", [150, 199, 1000, 1001])
+def test_run_throttles_progress_for_large_counts(count):
+    calls = []
+    ctx = ExecutionContext(on_progress=lambda f, m: calls.append((f, m)))
+
+    HelloPlugin().run({"name": "World", "count": count}, ctx)
+
+    # start + at most ~100 throttled updates (plus the final one) + done
+    assert len(calls) <= 103
+    assert calls[-2] == (1.0, f"Progress: {count}/{count}")
+
+
+def test_run_honours_cancellation():
+    ctx = ExecutionContext()
+    ctx.cancel_event.set()
+
+    result = HelloPlugin().run({"name": "World", "count": 5}, ctx)
+
+    assert result.status == ResultStatus.CANCELLED
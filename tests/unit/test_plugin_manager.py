@@ -2,16 +2,20 @@
 
 from __future__ import annotations
 
-import os
+import copy
+import json
 from pathlib import Path
-from textwrap import dedent
-from unittest.mock import MagicMock, patch
 
 import pytest
 import yaml
 
+from forge_cli import plugin_manager
 from forge_cli.plugin_manager import PluginManager, format_plugin_list
-from forge_cli.system_deps import SystemDepResult, SystemDepSpec
+
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _Dumper
 
 
 # ---------------------------------------------------------------------------
@@ -54,62 +58,104 @@ def _plugin_with_system_deps() -> dict:
     }
 
 
-def _make_manager(tmp_path: Path, registry_data: dict) -> PluginManager:
-    registry_file = tmp_path / "plugins-registry.yaml"
-    registry_file.write_text(yaml.dump(registry_data))
-    return PluginManager(registry_path=registry_file)
+def _write_registry(directory: Path, registry_data: dict) -> Path:
+    registry_file = directory / "plugins-registry.yaml"
+    registry_file.write_text(yaml.dump(registry_data, Dumper=_Dumper))
+    return registry_file
 
 
-# ---------------------------------------------------------------------------
-# install() — system_deps integration
-# ---------------------------------------------------------------------------
+def _uv_ok(args: list[str]) -> int:
+    return 0
+
+
+def _make_manager(tmp_path: Path, registry_data: dict) -> PluginManager:
+    return PluginManager(registry_path=_write_registry(tmp_path, registry_data), uv_runner=_uv_ok)
+
 
+@pytest.fixture(scope="session")
+def plain_registry_path(tmp_path_factory) -> Path:
+    """Registry with only plain-plugin, written once per session."""
+    return _write_registry(tmp_path_factory.mktemp("registry-plain"), _make_registry())
 
-def test_install_calls_system_deps_for_plugin_with_system_deps(tmp_path):
-    manager = _make_manager(tmp_path, _make_registry(_plugin_with_system_deps()))
 
-    success_result = SystemDepResult(
-        spec=SystemDepSpec(manager="go", package="github.com/org/go-tool@v1.2.3", binary="go-tool"),
-        already_installed=False,
-        success=True,
-        error_message=None,
+@pytest.fixture(scope="session")
+def go_registry_path(tmp_path_factory) -> Path:
+    """Registry with plain-plugin and go-tool, written once per session."""
+    return _write_registry(
+        tmp_path_factory.mktemp("registry-go"), _make_registry(_plugin_with_system_deps())
     )
 
-    with patch.object(manager, "_run_uv", return_value=0):
-        with patch("forge_cli.plugin_manager.install_system_deps", return_value=[success_result]) as mock_install:
-            with patch("forge_cli.plugin_manager.parse_system_deps", wraps=lambda info: [success_result.spec]) as mock_parse:
-                rc = manager.install("go-tool")
 
-    assert rc == 0
-    mock_install.assert_called_once()
+def _preloaded_manager(registry_path: Path) -> PluginManager:
+    manager = PluginManager(registry_path=registry_path, uv_runner=_uv_ok)
+    manager._load_registry()
+    return manager
+
+
+@pytest.fixture(scope="session")
+def _plain_template(plain_registry_path) -> PluginManager:
+    """PluginManager with the plain registry parsed once per session."""
+    return _preloaded_manager(plain_registry_path)
+
+
+@pytest.fixture(scope="session")
+def _go_template(go_registry_path) -> PluginManager:
+    """PluginManager with the go-tool registry parsed once per session."""
+    return _preloaded_manager(go_registry_path)
 
 
-def test_install_skips_system_deps_for_plugin_without_system_deps(tmp_path):
-    manager = _make_manager(tmp_path, _make_registry())
+@pytest.fixture
+def plain_manager(_plain_template) -> PluginManager:
+    return copy.deepcopy(_plain_template)
 
-    with patch.object(manager, "_run_uv", return_value=0):
-        with patch("forge_cli.plugin_manager.install_system_deps") as mock_install:
-            rc = manager.install("plain-plugin")
+
+@pytest.fixture
+def go_manager(_go_template) -> PluginManager:
+    return copy.deepcopy(_go_template)
+
+
+def _stub(monkeypatch, target, name: str, result) -> list:
+    """Replace ``target.name`` with a stub returning ``result``; return its call log."""
+    calls: list = []
+
+    def fake(*args, **kwargs):
+        calls.append(args)
+        return result
+
+    monkeypatch.setattr(target, name, fake)
+    return calls
+
+
+# ---------------------------------------------------------------------------
+# install() — system_deps integration
+# ---------------------------------------------------------------------------
+
+
+def test_install_calls_system_deps_for_plugin_with_system_deps(
+    go_manager, monkeypatch, go_spec, go_success_result
+):
+    install_calls = _stub(monkeypatch, plugin_manager, "install_system_deps", [go_success_result])
+    _stub(monkeypatch, plugin_manager, "parse_system_deps", [go_spec])
+    rc = go_manager.install("go-tool")
 
     assert rc == 0
-    mock_install.assert_not_called()
+    assert len(install_calls) == 1
 
 
-def test_install_warns_and_returns_0_on_system_dep_failure(tmp_path, capsys):
-    manager = _make_manager(tmp_path, _make_registry(_plugin_with_system_deps()))
+def test_install_skips_system_deps_for_plugin_without_system_deps(plain_manager, monkeypatch):
+    install_calls = _stub(monkeypatch, plugin_manager, "install_system_deps", [])
+    rc = plain_manager.install("plain-plugin")
 
-    spec = SystemDepSpec(manager="go", package="github.com/org/go-tool@v1.2.3", binary="go-tool")
-    failure_result = SystemDepResult(
-        spec=spec,
-        already_installed=False,
-        success=False,
-        error_message="Go runtime not found. Install Go from https://go.dev/dl/",
-    )
+    assert rc == 0
+    assert install_calls == []
 
-    with patch.object(manager, "_run_uv", return_value=0):
-        with patch("forge_cli.plugin_manager.install_system_deps", return_value=[failure_result]):
-            with patch("forge_cli.plugin_manager.parse_system_deps", return_value=[spec]):
-                rc = manager.install("go-tool")
+
+def test_install_warns_and_returns_0_on_system_dep_failure(
+    go_manager, monkeypatch, go_spec, go_failure_result, capsys
+):
+    _stub(monkeypatch, plugin_manager, "install_system_deps", [go_failure_result])
+    _stub(monkeypatch, plugin_manager, "parse_system_deps", [go_spec])
+    rc = go_manager.install("go-tool")
 
     assert rc == 0
     captured = capsys.readouterr()
@@ -117,61 +163,35 @@ def test_install_warns_and_returns_0_on_system_dep_failure(tmp_path, capsys):
     assert "may not function" in captured.out
 
 
-def test_install_returns_nonzero_on_uv_failure(tmp_path):
-    manager = _make_manager(tmp_path, _make_registry(_plugin_with_system_deps()))
-
-    spec = SystemDepSpec(manager="go", package="github.com/org/go-tool@v1.2.3", binary="go-tool")
-    success_result = SystemDepResult(
-        spec=spec,
-        already_installed=False,
-        success=True,
-        error_message=None,
-    )
-
-    with patch.object(manager, "_run_uv", return_value=1):
-        with patch("forge_cli.plugin_manager.install_system_deps", return_value=[success_result]):
-            with patch("forge_cli.plugin_manager.parse_system_deps", return_value=[spec]):
-                rc = manager.install("go-tool")
+def test_install_returns_nonzero_on_uv_failure(
+    go_registry_path, monkeypatch, go_spec, go_success_result
+):
+    manager = PluginManager(registry_path=go_registry_path, uv_runner=lambda args: 1)
+    _stub(monkeypatch, plugin_manager, "install_system_deps", [go_success_result])
+    _stub(monkeypatch, plugin_manager, "parse_system_deps", [go_spec])
+    rc = manager.install("go-tool")
 
     assert rc == 1
 
 
-def test_install_strict_returns_nonzero_on_system_dep_failure(tmp_path, capsys):
-    manager = _make_manager(tmp_path, _make_registry(_plugin_with_system_deps()))
-
-    spec = SystemDepSpec(manager="go", package="github.com/org/go-tool@v1.2.3", binary="go-tool")
-    failure_result = SystemDepResult(
-        spec=spec,
-        already_installed=False,
-        success=False,
-        error_message="Go runtime not found.",
-    )
-
-    with patch.object(manager, "_run_uv", return_value=0):
-        with patch("forge_cli.plugin_manager.install_system_deps", return_value=[failure_result]):
-            with patch("forge_cli.plugin_manager.parse_system_deps", return_value=[spec]):
-                rc = manager.install("go-tool", strict=True)
+def test_install_strict_returns_nonzero_on_system_dep_failure(
+    go_manager, monkeypatch, go_spec, go_failure_result, capsys
+):
+    _stub(monkeypatch, plugin_manager, "install_system_deps", [go_failure_result])
+    _stub(monkeypatch, plugin_manager, "parse_system_deps", [go_spec])
+    rc = go_manager.install("go-tool", strict=True)
 
     assert rc == 1
     captured = capsys.readouterr()
     assert "strict" in captured.err
 
 
-def test_install_strict_returns_0_when_no_system_dep_failures(tmp_path):
-    manager = _make_manager(tmp_path, _make_registry(_plugin_with_system_deps()))
-
-    spec = SystemDepSpec(manager="go", package="github.com/org/go-tool@v1.2.3", binary="go-tool")
-    success_result = SystemDepResult(
-        spec=spec,
-        already_installed=False,
-        success=True,
-        error_message=None,
-    )
-
-    with patch.object(manager, "_run_uv", return_value=0):
-        with patch("forge_cli.plugin_manager.install_system_deps", return_value=[success_result]):
-            with patch("forge_cli.plugin_manager.parse_system_deps", return_value=[spec]):
-                rc = manager.install("go-tool", strict=True)
+def test_install_strict_returns_0_when_no_system_dep_failures(
+    go_manager, monkeypatch, go_spec, go_success_result
+):
+    _stub(monkeypatch, plugin_manager, "install_system_deps", [go_success_result])
+    _stub(monkeypatch, plugin_manager, "parse_system_deps", [go_spec])
+    rc = go_manager.install("go-tool", strict=True)
 
     assert rc == 0
 
@@ -181,11 +201,8 @@ def test_install_strict_returns_0_when_no_system_dep_failures(tmp_path):
 # ---------------------------------------------------------------------------
 
 
-def test_remove_prints_note_for_plugin_with_system_deps(tmp_path, capsys):
-    manager = _make_manager(tmp_path, _make_registry(_plugin_with_system_deps()))
-
-    with patch.object(manager, "_run_uv", return_value=0):
-        rc = manager.remove("go-tool")
+def test_remove_prints_note_for_plugin_with_system_deps(go_manager, capsys):
+    rc = go_manager.remove("go-tool")
 
     assert rc == 0
     captured = capsys.readouterr()
@@ -193,35 +210,93 @@ def test_remove_prints_note_for_plugin_with_system_deps(tmp_path, capsys):
     assert "go-tool" in captured.out
 
 
-def test_remove_no_note_for_plugin_without_system_deps(tmp_path, capsys):
-    manager = _make_manager(tmp_path, _make_registry())
-
-    with patch.object(manager, "_run_uv", return_value=0):
-        rc = manager.remove("plain-plugin")
+def test_remove_no_note_for_plugin_without_system_deps(plain_manager, capsys):
+    rc = plain_manager.remove("plain-plugin")
 
     assert rc == 0
     captured = capsys.readouterr()
     assert "System dependencies" not in captured.out
 
 
+@pytest.fixture
+def fake_home(tmp_path, monkeypatch):
+    """Point HOME (and so the FORGE config dir) at tmp_path."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return tmp_path
+
+
+def test_remove_binary_plugin_rewrites_cache_without_temp_files(tmp_path, fake_home):
+    cache_path = fake_home / ".config" / "forge" / "binary-plugins.json"
+    cache_path.parent.mkdir(parents=True)
+    cache_path.write_text(
+        json.dumps(
+            {
+                "bin-tool": {"binary_path": "/x/bin-tool", "introspect_data": {}},
+                "other": {"binary_path": "/x/other", "introspect_data": {}},
+            }
+        )
+    )
+    manager = _make_manager(
+        tmp_path,
+        _make_registry(
+            {
+                "bin-tool": {
+                    "plugin_type": "binary",
+                    "binary_source": {"binary": "bin-tool", "install_dir": str(tmp_path)},
+                    "description": "Binary plugin",
+                }
+            }
+        ),
+    )
+
+    rc = manager.remove("bin-tool")
+
+    assert rc == 0
+    assert list(json.loads(cache_path.read_text())) == ["other"]
+    assert list(cache_path.parent.glob("*.tmp")) == []
+
+
+def _raise_oserror(*args, **kwargs):
+    raise OSError("No space left on device")
+
+
+@pytest.mark.parametrize(
+    "target,name",
+    [
+        pytest.param(plugin_manager.json, "dumps", id="write"),
+        pytest.param(plugin_manager.os, "replace", id="replace"),
+    ],
+)
+def test_write_binary_cache_removes_temp_file_on_failure(tmp_path, monkeypatch, target, name):
+    cache_path = tmp_path / "binary-plugins.json"
+    cache_path.write_text('{"old": {}}')
+    monkeypatch.setattr(target, name, _raise_oserror)
+
+    with pytest.raises(OSError, match="No space left"):
+        plugin_manager._write_binary_cache(cache_path, {"new": {}})
+
+    assert list(tmp_path.iterdir()) == [cache_path]
+    assert cache_path.read_text() == '{"old": {}}'
+
+
 # ---------------------------------------------------------------------------
 # PluginManager registry path discovery
 # ---------------------------------------------------------------------------
 
 
-def test_registry_path_uses_env_var(tmp_path):
+def test_registry_path_uses_env_var(tmp_path, monkeypatch):
     registry_data = _make_registry()
     registry_file = tmp_path / "custom-registry.yaml"
-    registry_file.write_text(yaml.dump(registry_data))
+    registry_file.write_text(yaml.dump(registry_data, Dumper=_Dumper))
 
-    with patch.dict(os.environ, {"FORGE_PLUGIN_REGISTRY": str(registry_file)}):
-        manager = PluginManager()  # no explicit path
-        plugins = manager.list_available()
+    monkeypatch.setenv("FORGE_PLUGIN_REGISTRY", str(registry_file))
+    manager = PluginManager()  # no explicit path
+    plugins = manager.list_available()
 
     assert "plain-plugin" in plugins
 
 
-def test_registry_path_env_var_takes_precedence_over_default(tmp_path):
+def test_registry_path_env_var_takes_precedence_over_default(tmp_path, monkeypatch):
     custom_registry = _make_registry({"custom-plugin": {
         "package": "forge-custom",
         "source": "git+https://example.com/custom.git",
@@ -231,11 +306,11 @@ def test_registry_path_env_var_takes_precedence_over_default(tmp_path):
         "private": False,
     }})
     registry_file = tmp_path / "env-registry.yaml"
-    registry_file.write_text(yaml.dump(custom_registry))
+    registry_file.write_text(yaml.dump(custom_registry, Dumper=_Dumper))
 
-    with patch.dict(os.environ, {"FORGE_PLUGIN_REGISTRY": str(registry_file)}):
-        manager = PluginManager()
-        plugins = manager.list_available()
+    monkeypatch.setenv("FORGE_PLUGIN_REGISTRY", str(registry_file))
+    manager = PluginManager()
+    plugins = manager.list_available()
 
     assert "custom-plugin" in plugins
 
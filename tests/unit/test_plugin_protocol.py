@@ -1,5 +1,7 @@
 """Tests for the ToolPlugin protocol."""
 
+import pytest
+
 from forge_core.plugin import ResultStatus, ToolParam, ToolPlugin, ToolResult
 
 
@@ -22,16 +24,6 @@ def test_tool_param_creation():
     assert param.choices == ["a", "b", "c"]
 
 
-def test_tool_param_defaults():
-    """Test ToolParam default values."""
-    param = ToolParam(name="test", description="Test parameter")
-
-    assert param.type == "str"
-    assert param.required is False
-    assert param.default is None
-    assert param.choices is None
-
-
 def test_tool_result_creation():
     """Test ToolResult creation."""
     result = ToolResult(
@@ -47,12 +39,27 @@ def test_tool_result_creation():
     assert result.artifacts == {"report": "/path/to/report.txt"}
 
 
-def test_tool_result_defaults():
-    """Test ToolResult default values."""
-    result = ToolResult(status=ResultStatus.SUCCESS, summary="Done")
+_PARAM = ToolParam(name="test", description="Test parameter")
+_RESULT = ToolResult(status=ResultStatus.SUCCESS, summary="Done")
+
 
-    assert result.data == {}
-    assert result.artifacts == {}
+@pytest.mark.parametrize(
+    "obj,attr,expected",
+    [
+        pytest.param(_PARAM, "type", "str", id="param-type"),
+        pytest.param(_PARAM, "required", False, id="param-required"),
+        pytest.param(_PARAM, "default", None, id="param-default"),
+        pytest.param(_PARAM, "choices", None, id="param-choices"),
+        pytest.param(_RESULT, "data", {}, id="result-data"),
+        pytest.param(_RESULT, "artifacts", {}, id="result-artifacts"),
+    ],
+)
+def test_default_values(obj, attr, expected):
+    """Test ToolParam and ToolResult default values."""
+    value = getattr(obj, attr)
+
+    assert value == expected
+    assert type(value) is type(expected)
 
 
 def test_plugin_protocol_compliance(mock_plugin):
@@ -74,14 +81,11 @@ def test_plugin_get_params(mock_plugin):
     assert params[0].required is True
 
 
-def test_plugin_run(mock_plugin):
+def test_plugin_run(mock_plugin, shared_ctx):
     """Test plugin execution."""
-    from forge_core.context import ExecutionContext
-
-    ctx = ExecutionContext()
     args = {"input": "test-value"}
 
-    result = mock_plugin.run(args, ctx)
+    result = mock_plugin.run(args, shared_ctx)
 
     assert result.status == ResultStatus.SUCCESS
     assert "test-value" in result.summary
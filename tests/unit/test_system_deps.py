@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
 
 import pytest
 
+from forge_cli import system_deps
 from forge_cli.system_deps import (
-    SystemDepResult,
     SystemDepSpec,
     install_system_deps,
     parse_system_deps,
@@ -62,114 +62,102 @@ def test_parse_malformed_entry_skipped(capsys):
 
 
 # ---------------------------------------------------------------------------
-# install_system_deps — skip when binary present
+# Helpers
 # ---------------------------------------------------------------------------
 
 
-def test_install_skips_when_binary_present():
-    spec = SystemDepSpec(manager="go", package="github.com/org/tool@v1.0.0", binary="tool")
-    with patch("forge_cli.system_deps.shutil.which", return_value="/usr/local/bin/tool"):
-        with patch("forge_cli.system_deps.subprocess.run") as mock_run:
-            results = install_system_deps([spec])
-
-    assert len(results) == 1
-    assert results[0].already_installed is True
-    assert results[0].success is True
-    mock_run.assert_not_called()
-
-
-# ---------------------------------------------------------------------------
-# _install_go
-# ---------------------------------------------------------------------------
+def _fake_which(monkeypatch, missing: set[str]) -> None:
+    """Make every binary resolvable on PATH except those named in ``missing``."""
+    monkeypatch.setattr(
+        system_deps.shutil,
+        "which",
+        lambda name: None if name in missing else f"/usr/local/bin/{name}",
+    )
 
 
-def test_go_install_success():
-    spec = SystemDepSpec(manager="go", package="github.com/org/tool@v1.0.0", binary="tool")
+def _fake_run(monkeypatch, returncode: int = 0, stderr: str = "") -> list:
+    """Replace subprocess.run with a stub; return the list of (args, kwargs) it saw."""
+    calls: list = []
 
-    def fake_which(name):
-        return None if name == "tool" else "/usr/local/go/bin/go"
+    def fake(*args, **kwargs):
+        calls.append((args, kwargs))
+        return SimpleNamespace(returncode=returncode, stderr=stderr)
 
-    mock_result = MagicMock()
-    mock_result.returncode = 0
-    mock_result.stderr = ""
+    monkeypatch.setattr(system_deps.subprocess, "run", fake)
+    return calls
 
-    with patch("forge_cli.system_deps.shutil.which", side_effect=fake_which):
-        with patch("forge_cli.system_deps.subprocess.run", return_value=mock_result) as mock_run:
-            results = install_system_deps([spec])
 
-    assert results[0].success is True
-    assert results[0].already_installed is False
-    mock_run.assert_called_once_with(
+INSTALLER_CASES = [
+    pytest.param(
+        SystemDepSpec(manager="go", package="github.com/org/tool@v1.0.0", binary="tool"),
         ["go", "install", "github.com/org/tool@v1.0.0"],
-        capture_output=True,
-        text=True,
-    )
-
-
-def test_go_runtime_not_found():
-    spec = SystemDepSpec(manager="go", package="github.com/org/tool@v1.0.0", binary="tool")
+        "https://go.dev/dl/",
+        id="go",
+    ),
+    pytest.param(
+        SystemDepSpec(manager="npm", package="@org/ts-tool@2.0.0", binary="ts-tool"),
+        ["npm", "install", "-g", "@org/ts-tool@2.0.0"],
+        "https://nodejs.org/",
+        id="npm",
+    ),
+]
 
-    with patch("forge_cli.system_deps.shutil.which", return_value=None):
-        with patch("forge_cli.system_deps.subprocess.run") as mock_run:
-            results = install_system_deps([spec])
 
-    assert results[0].success is False
-    assert "https://go.dev/dl/" in results[0].error_message
-    mock_run.assert_not_called()
+# ---------------------------------------------------------------------------
+# install_system_deps — skip when binary present
+# ---------------------------------------------------------------------------
 
 
-def test_go_subprocess_failure():
+def test_install_skips_when_binary_present(monkeypatch):
     spec = SystemDepSpec(manager="go", package="github.com/org/tool@v1.0.0", binary="tool")
+    _fake_which(monkeypatch, missing=set())
+    run_calls = _fake_run(monkeypatch)
 
-    def fake_which(name):
-        return None if name == "tool" else "/usr/local/go/bin/go"
-
-    mock_result = MagicMock()
-    mock_result.returncode = 1
-    mock_result.stderr = "build failed: module not found"
-
-    with patch("forge_cli.system_deps.shutil.which", side_effect=fake_which):
-        with patch("forge_cli.system_deps.subprocess.run", return_value=mock_result):
-            results = install_system_deps([spec])
+    results = install_system_deps([spec])
 
-    assert results[0].success is False
-    assert "build failed: module not found" in results[0].error_message
+    assert len(results) == 1
+    assert results[0].already_installed is True
+    assert results[0].success is True
+    assert run_calls == []
 
 
 # ---------------------------------------------------------------------------
-# _install_npm
+# _install_go / _install_npm
 # ---------------------------------------------------------------------------
 
 
-def test_npm_install_success():
-    spec = SystemDepSpec(manager="npm", package="@org/ts-tool@2.0.0", binary="ts-tool")
+@pytest.mark.parametrize("spec,install_cmd,runtime_url", INSTALLER_CASES)
+def test_install_success(monkeypatch, spec, install_cmd, runtime_url):
+    _fake_which(monkeypatch, missing={spec.binary})
+    run_calls = _fake_run(monkeypatch, returncode=0)
 
-    def fake_which(name):
-        return None if name == "ts-tool" else "/usr/local/bin/npm"
+    results = install_system_deps([spec])
 
-    mock_result = MagicMock()
-    mock_result.returncode = 0
-    mock_result.stderr = ""
+    assert results[0].success is True
+    assert results[0].already_installed is False
+    assert run_calls == [((install_cmd,), {"capture_output": True, "text": True})]
 
-    with patch("forge_cli.system_deps.shutil.which", side_effect=fake_which):
-        with patch("forge_cli.system_deps.subprocess.run", return_value=mock_result) as mock_run:
-            results = install_system_deps([spec])
 
-    assert results[0].success is True
-    mock_run.assert_called_once_with(
-        ["npm", "install", "-g", "@org/ts-tool@2.0.0"],
-        capture_output=True,
-        text=True,
-    )
+@pytest.mark.parametrize("spec,install_cmd,runtime_url", INSTALLER_CASES)
+def test_runtime_not_found(monkeypatch, spec, install_cmd, runtime_url):
+    _fake_which(monkeypatch, missing={spec.binary, install_cmd[0]})
+    run_calls = _fake_run(monkeypatch)
 
+    results = install_system_deps([spec])
+
+    assert results[0].success is False
+    assert runtime_url in results[0].error_message
+    assert run_calls == []
 
-def test_npm_runtime_not_found():
-    spec = SystemDepSpec(manager="npm", package="@org/ts-tool@2.0.0", binary="ts-tool")
 
-    with patch("forge_cli.system_deps.shutil.which", return_value=None):
-        with patch("forge_cli.system_deps.subprocess.run") as mock_run:
-            results = install_system_deps([spec])
+@pytest.mark.parametrize("spec,install_cmd,runtime_url", INSTALLER_CASES)
+def test_subprocess_failure(monkeypatch, spec, install_cmd, runtime_url):
+    _fake_which(monkeypatch, missing={spec.binary})
+    run_calls = _fake_run(monkeypatch, returncode=1, stderr="build failed: module not found")
+
+    results = install_system_deps([spec])
 
     assert results[0].success is False
-    assert "https://nodejs.org/" in results[0].error_message
-    mock_run.assert_not_called()
+    assert "build failed: module not found" in results[0].error_message
+    assert runtime_url not in results[0].error_message
+    assert run_calls == [((install_cmd,), {"capture_output": True, "text": True})]